@@ -0,0 +1,420 @@
+"""Processamento das planilhas, cache em parquet e renderização dos dashboards de despesas."""
+import glob
+import hashlib
+import io
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+
+# Leitor Excel em Rust (bem mais rápido); cai para o openpyxl se não estiver instalado.
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
+# Conversão JIT da coluna 'valor'; sem o numba, usa a limpeza por regex do pandas.
+try:
+    from numba import njit
+    NUMBA_DISPONIVEL = True
+except ImportError:
+    NUMBA_DISPONIVEL = False
+
+# --- TEMA E GRÁFICOS ---
+
+def criar_tema_minimalista():
+    return go.Layout(
+        font=dict(family="sans-serif", size=12, color="#FAFAFA"),
+        plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)",
+        xaxis=dict(showgrid=False, zeroline=False), yaxis=dict(showgrid=False, zeroline=False),
+        legend=dict(font=dict(color="#FAFAFA")),
+        title=dict(font=dict(size=16, color="#FAFAFA"), x=0.05)
+    )
+
+plotly_template = criar_tema_minimalista()
+
+CORES_STATUS = {'pago': '#2ca02c', 'não pago': '#d62728', 'em aberto': '#ff7f0e'}
+
+def criar_graficos_base():
+    """Monta uma vez os quatro gráficos (layout e tema); a cada rerun só os dados são trocados."""
+    evolucao = go.Figure(go.Bar(marker_color='#FF8C69', hovertemplate="Mês/Ano=%{x}<br>Valor (R$)=%{y}<extra></extra>"))
+    evolucao.update_layout(plotly_template, title_text="<b>Evolução Mensal das Despesas</b>", xaxis_title="Mês/Ano", yaxis_title="Valor (R$)")
+
+    status = go.Figure(go.Pie(hole=0.7, textinfo='percent', textfont_size=16, hovertemplate="Status=%{label}<br>Valor=%{value}<extra></extra>"))
+    status.update_layout(plotly_template, title_text="<b>Proporção por Status</b>", showlegend=True)
+
+    categorias = go.Figure(go.Bar(marker_color='#2ca02c', hovertemplate="Categoria=%{x}<br>Valor (R$)=%{y}<extra></extra>"))
+    categorias.update_layout(plotly_template, title_text="<b>Top 10 Categorias</b>", xaxis_title="Categoria", yaxis_title="Valor (R$)")
+
+    centros_custo = go.Figure(go.Bar(orientation='h', marker_color='#1f77b4', hovertemplate="Centro de Custo=%{y}<br>Valor (R$)=%{x}<extra></extra>"))
+    centros_custo.update_layout(plotly_template, title_text="<b>Principais Centros de Custo</b>", xaxis_title="Valor (R$)", yaxis_title="Centro de Custo")
+
+    return {'evolucao': evolucao, 'status': status, 'categorias': categorias, 'centros_custo': centros_custo}
+
+# --- FUNÇÕES DE GERENCIAMENTO DE DADOS ---
+
+# Remove "R$", pontos de milhar e espaços do campo 'valor' numa única passada.
+LIMPEZA_VALOR = re.compile(r'[R$\s.]')
+
+COLUNAS_NECESSARIAS = ['data', 'descrição', 'tipo', 'valor', 'despesa', 'status', 'centro de custos']
+TIPOS_COLUNAS = {
+    'descrição': 'string', 'tipo': 'category', 'despesa': 'category', 'status': 'category',
+    'centro de custos': 'string', 'valor': 'string'
+}
+COLUNAS_CATEGORICAS = ('status', 'categoria', 'centro_custo')
+# Cada leitura do cache pede só as colunas de que precisa; 'descricao' só entra na tabela detalhada.
+COLUNAS_FILTROS = ['categoria', 'status', 'centro_custo']
+COLUNAS_AGREGADOS = ['categoria', 'status', 'centro_custo', 'valor_abs', 'mes_key']
+COLUNAS_DETALHE = ['data', 'descricao', 'categoria', 'valor_abs', 'status', 'centro_custo']
+LANCAMENTOS_POR_PAGINA = 200
+TIPOS_ARROW = {pa.string(): pd.ArrowDtype(pa.string()), pa.large_string(): pd.ArrowDtype(pa.large_string())}
+MESES_PT = ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez']
+
+def formatar_mes_ano(chave_mes):
+    """Converte uma chave numérica ano*100 + mês no rótulo 'AAAA-MM (Mês)'."""
+    ano, mes = divmod(int(chave_mes), 100)
+    return f"{ano}-{mes:02d} ({MESES_PT[mes - 1]})"
+
+# Soma por grupo com o kernel do numba. Sem parallel=True pelo mesmo motivo do conversor de
+# valores abaixo: o script roda numa thread do Streamlit.
+OPCOES_NUMBA_GROUPBY = {'nopython': True, 'nogil': True, 'parallel': False}
+
+# Acima disso a mantissa deixaria de ser exata num float64 (2**53).
+MAX_DIGITOS_KERNEL = 15
+
+def _converter_bytes_brl(offsets, dados, validos, saida, pendentes):
+    """Lê o caso comum 'R$ 1.234,56' direto dos bytes UTF-8 do Arrow.
+
+    Textos fora do caso comum (qualquer byte não ASCII, letras como em '1e3', espaços
+    exóticos ou números longos demais) são marcados em `pendentes` para a versão por regex.
+    """
+    for i in range(saida.size):
+        saida[i] = np.nan
+        pendentes[i] = False
+        if not validos[i]:
+            continue
+        mantissa = 0
+        casas = 0
+        digitos = 0
+        sinal = 1.0
+        tem_sinal = False
+        depois_virgula = False
+        valido = True
+        j = offsets[i]
+        fim = offsets[i + 1]
+        while j < fim:
+            b = dados[j]
+            if 48 <= b <= 57:
+                mantissa = mantissa * 10 + (b - 48)
+                digitos += 1
+                if depois_virgula:
+                    casas += 1
+            elif b == 44:  # ','
+                if depois_virgula:
+                    valido = False
+                    break
+                depois_virgula = True
+            elif b == 45 or b == 43:  # '-' ou '+', só antes do número
+                if tem_sinal or digitos > 0 or depois_virgula:
+                    valido = False
+                    break
+                tem_sinal = True
+                if b == 45:
+                    sinal = -1.0
+            elif not (b == 82 or b == 36 or b == 46 or b == 32 or 9 <= b <= 13):  # 'R', '$', '.', espaços ASCII
+                pendentes[i] = True
+                break
+            j += 1
+        if digitos > MAX_DIGITOS_KERNEL:
+            pendentes[i] = True
+        if valido and digitos > 0 and not pendentes[i]:
+            saida[i] = sinal * mantissa / 10.0 ** casas
+
+if NUMBA_DISPONIVEL:
+    # cache=True funciona por estar num módulo importável (o script do Streamlit não é).
+    # Sem parallel=True: o script roda numa thread do Streamlit, e o pool de threads padrão
+    # do numba (workqueue) não é seguro para isso e impede o processo de encerrar.
+    _converter_bytes_brl_jit = njit(cache=True, nogil=True)(_converter_bytes_brl)
+
+def _converter_valores_brl_regex(valores):
+    """Versão por regex da conversão; sem numba, é usada para a coluna inteira."""
+    valor_limpo = valores.str.replace(LIMPEZA_VALOR, '', regex=True).str.replace(',', '.', regex=False)
+    return pd.to_numeric(valor_limpo, errors='coerce').fillna(0.0).astype('float64')
+
+def converter_valores_brl(valores):
+    """Converte a coluna 'valor' (texto no formato brasileiro) para float64, com 0 onde não for número."""
+    if not NUMBA_DISPONIVEL:
+        return _converter_valores_brl_regex(valores)
+
+    # O Arrow entrega os textos como um buffer contíguo de bytes + offsets, sem objetos Python por linha.
+    texto = pa.array(valores, type=pa.large_string(), from_pandas=True)
+    _, buffer_offsets, buffer_dados = texto.buffers()
+    offsets = np.frombuffer(buffer_offsets, dtype=np.int64)[texto.offset:texto.offset + len(texto) + 1]
+    dados = np.frombuffer(buffer_dados, dtype=np.uint8) if buffer_dados is not None else np.empty(0, dtype=np.uint8)
+    validos = texto.is_valid().to_numpy(zero_copy_only=False)
+
+    saida = np.empty(len(texto), dtype=np.float64)
+    pendentes = np.empty(len(texto), dtype=np.bool_)
+    _converter_bytes_brl_jit(offsets, dados, validos, saida, pendentes)
+    resultado = pd.Series(saida, index=valores.index).fillna(0.0)
+    if pendentes.any():
+        resultado[pendentes] = _converter_valores_brl_regex(valores[pendentes]).to_numpy()
+    return resultado
+
+class PlanilhaInvalida(ValueError):
+    """Planilha enviada sem o formato esperado (por exemplo, sem alguma coluna obrigatória)."""
+
+# Os arquivos de cache se chamam "<nome>-<hash do conteúdo>.parquet".
+SUFIXO_HASH = re.compile(r'-[0-9a-f]{24}$')
+
+def get_nome_exibicao(nome_dashboard):
+    """Retorna o nome do dashboard sem o sufixo de hash do arquivo de cache."""
+    return SUFIXO_HASH.sub('', nome_dashboard)
+
+def get_lista_dashboards_salvos(cache_dir):
+    """Retorna uma lista com os nomes dos dashboards salvos na pasta de cache."""
+    cache_dir = Path(cache_dir)
+    if not cache_dir.exists():
+        return []
+
+    return sorted(caminho.stem for caminho in cache_dir.glob("*.parquet"))
+
+def get_caminho_dashboard(cache_dir, nome_dashboard):
+    """Retorna o caminho do arquivo .parquet de um dashboard salvo."""
+    return Path(cache_dir) / f"{nome_dashboard}.parquet"
+
+def processar_e_salvar_planilha(arquivo_excel, cache_dir):
+    """Processa uma planilha e a salva em um arquivo .parquet na pasta de cache.
+
+    Lança PlanilhaInvalida se faltar alguma coluna obrigatória na planilha.
+    """
+    cache_dir = Path(cache_dir)
+    # Garante que o diretório de cache exista ANTES de tentar salvar.
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # O cache é endereçado pelo conteúdo: reenviar a mesma planilha não a processa de novo.
+    conteudo = arquivo_excel.getvalue()
+    hash_conteudo = hashlib.blake2b(conteudo, digest_size=12).hexdigest()
+    nome_base = Path(arquivo_excel.name).stem.replace(" ", "_")
+    caminho_cache = get_caminho_dashboard(cache_dir, f"{nome_base}-{hash_conteudo}")
+    if caminho_cache.exists():
+        return
+
+    erro_colunas = f"Erro: Colunas ausentes. Verifique se a planilha contém: {', '.join(COLUNAS_NECESSARIAS)}."
+    if EXCEL_ENGINE == 'calamine':
+        # O calamine já devolve células tipadas, mas ler só o cabeçalho custaria quase outra
+        # leitura completa: lê tudo de uma vez e aplica os tipos depois de normalizar os nomes.
+        df = pd.read_excel(
+            io.BytesIO(conteudo), engine=EXCEL_ENGINE, sheet_name=0,
+            usecols=lambda c: str(c).lower().strip() in COLUNAS_NECESSARIAS
+        )
+        df.columns = [str(col).lower().strip() for col in df.columns]
+        if not all(col in df.columns for col in COLUNAS_NECESSARIAS):
+            raise PlanilhaInvalida(erro_colunas)
+        df = df.astype(TIPOS_COLUNAS)
+    else:
+        # No openpyxl o cabeçalho sai barato: lê só ele para validar as colunas e descobrir os
+        # nomes originais, já que dtype/parse_dates exigem os nomes exatamente como estão na planilha.
+        cabecalho = pd.read_excel(io.BytesIO(conteudo), engine=EXCEL_ENGINE, sheet_name=0, nrows=0)
+        nomes_originais = {str(col).lower().strip(): col for col in cabecalho.columns}
+        if not all(col in nomes_originais for col in COLUNAS_NECESSARIAS):
+            raise PlanilhaInvalida(erro_colunas)
+
+        df = pd.read_excel(
+            io.BytesIO(conteudo), engine=EXCEL_ENGINE, sheet_name=0,
+            usecols=lambda c: str(c).lower().strip() in COLUNAS_NECESSARIAS,
+            dtype={nomes_originais[col]: tipo for col, tipo in TIPOS_COLUNAS.items()},
+            parse_dates=[nomes_originais['data']]
+        )
+        df.columns = [str(col).lower().strip() for col in df.columns]
+
+    df.rename(columns={'descrição': 'descricao', 'despesa': 'categoria', 'tipo': 'tipo_lancamento', 'centro de custos': 'centro_custo'}, inplace=True)
+    if not pd.api.types.is_datetime64_any_dtype(df['data']):
+        # parse_dates deixa a coluna como objeto se houver células inválidas.
+        df['data'] = pd.to_datetime(df['data'], errors='coerce')
+    # O texto original de 'valor' não é mais usado depois da conversão.
+    df['valor_abs'] = converter_valores_brl(df.pop('valor'))
+    df['status'] = df['status'].str.lower().str.strip()
+
+    df_despesas = df[df['tipo_lancamento'].str.lower() == 'despesa'].copy()
+    df_despesas.dropna(subset=['data'], inplace=True)
+
+    # Mês guardado como inteiro ano*100 + mês; o rótulo "AAAA-MM (Mês)" só é montado nos agregados.
+    df_despesas['mes_key'] = df_despesas['data'].dt.year.astype('int32') * 100 + df_despesas['data'].dt.month.astype('int32')
+
+    # Colunas de baixa cardinalidade viram categorias (dicionário no Arrow): arquivo menor e leitura mais rápida.
+    for coluna in COLUNAS_CATEGORICAS:
+        df_despesas[coluna] = df_despesas[coluna].astype('category')
+
+    # Grava num arquivo temporário e troca de uma vez, para nunca deixar um cache pela metade.
+    caminho_temporario = caminho_cache.with_name(caminho_cache.name + ".tmp")
+    df_despesas.to_parquet(
+        caminho_temporario, engine='pyarrow', compression='zstd', compression_level=3,
+        use_dictionary=True, row_group_size=131072
+    )
+    caminho_temporario.replace(caminho_cache)
+
+    # Remove as versões anteriores da mesma planilha.
+    for caminho_antigo in cache_dir.glob(f"{glob.escape(nome_base)}*.parquet"):
+        if caminho_antigo != caminho_cache and get_nome_exibicao(caminho_antigo.stem) == nome_base:
+            caminho_antigo.unlink()
+
+def carregar_dashboard(caminho_arquivo, colunas=None):
+    """Lê um dashboard salvo garantindo que as colunas de baixa cardinalidade sejam categorias."""
+    # Textos ficam como strings do Arrow (sem um objeto Python por linha); colunas com
+    # dicionário continuam virando categorias e números/datas continuam em NumPy.
+    # memory_map: as páginas do parquet são mapeadas do disco em vez de copiadas para um buffer.
+    # Arquivos salvos antes da chave numérica de mês não têm 'mes_key': ela é refeita a partir de 'data'.
+    derivar_mes_key = (colunas is None or 'mes_key' in colunas) and 'mes_key' not in pq.read_schema(caminho_arquivo).names
+    colunas_leitura = colunas
+    if derivar_mes_key and colunas is not None:
+        colunas_leitura = [coluna for coluna in colunas if coluna != 'mes_key']
+        if 'data' not in colunas_leitura:
+            colunas_leitura.append('data')
+    tabela = pq.read_table(caminho_arquivo, columns=colunas_leitura, memory_map=True)
+    # Arquivos salvos antes da gravação categórica ainda trazem essas colunas como texto: o
+    # dicionário é montado ainda no Arrow, para virarem categorias comuns e não strings do Arrow.
+    for coluna in COLUNAS_CATEGORICAS:
+        if coluna in tabela.column_names and tabela.schema.field(coluna).type in TIPOS_ARROW:
+            tabela = tabela.set_column(
+                tabela.schema.get_field_index(coluna), coluna, tabela.column(coluna).dictionary_encode()
+            )
+    df = tabela.to_pandas(types_mapper=TIPOS_ARROW.get)
+    # Colunas totalmente vazias chegam sem tipo de texto e vão para categoria pelo pandas.
+    for coluna in COLUNAS_CATEGORICAS:
+        if coluna in df.columns and not isinstance(df[coluna].dtype, pd.CategoricalDtype):
+            df[coluna] = df[coluna].astype('category')
+    if derivar_mes_key:
+        df['mes_key'] = df['data'].dt.year.astype('int32') * 100 + df['data'].dt.month.astype('int32')
+        if colunas is not None:
+            df = df[colunas]
+    return df
+
+@st.cache_data
+def get_opcoes_filtros(caminho_arquivo):
+    """Retorna as opções dos filtros (categorias, status e centros de custo) de um dashboard salvo."""
+    df = carregar_dashboard(caminho_arquivo, colunas=COLUNAS_FILTROS)
+    return (
+        sorted(df['categoria'].dropna().unique()),
+        sorted(df['status'].dropna().unique()),
+        sorted(df['centro_custo'].dropna().astype(str).unique())
+    )
+
+def aplicar_filtros(df, categoria_selecionada, status_selecionado, centro_custo_selecionado):
+    """Aplica os filtros da barra lateral ao DataFrame de despesas."""
+    # Combina todos os filtros numa única máscara e recorta o DataFrame uma só vez.
+    mascara = np.ones(len(df), dtype=bool)
+    if 'Todas' not in categoria_selecionada: mascara &= df['categoria'].isin(categoria_selecionada).to_numpy()
+    if status_selecionado != 'Todos': mascara &= df['status'].eq(status_selecionado).to_numpy(dtype=bool, na_value=False)
+    if 'Todos' not in centro_custo_selecionado: mascara &= df['centro_custo'].isin(centro_custo_selecionado).to_numpy()
+    return df.loc[mascara]
+
+def get_maiores_valores(serie, quantidade, crescente=False):
+    """Retorna os `quantidade` maiores valores da série, do maior para o menor (ou o contrário, se crescente)."""
+    valores = serie.to_numpy()
+    if valores.size > quantidade:
+        # Seleção parcial: só os k maiores são separados, sem ordenar todos os grupos.
+        indices = np.argpartition(-valores, quantidade - 1)[:quantidade]
+    else:
+        indices = np.arange(valores.size)
+    ordem = indices[np.argsort(-valores[indices], kind='stable')]
+    return serie.iloc[ordem[::-1] if crescente else ordem]
+
+@st.cache_data
+def calcular_agregados(caminho_arquivo, categoria_selecionada, status_selecionado, centro_custo_selecionado):
+    """Calcula os agregados dos gráficos para uma combinação de filtros (as seleções devem ser tuplas)."""
+    df = carregar_dashboard(caminho_arquivo, colunas=COLUNAS_AGREGADOS)
+    df = aplicar_filtros(df, categoria_selecionada, status_selecionado, centro_custo_selecionado)
+
+    # Uma única passada sobre os lançamentos; os quatro gráficos saem de somas marginais
+    # dessa tabela pequena. dropna=False mantém no total as linhas sem centro de custo.
+    agrupado = df.groupby(['mes_key', 'status', 'categoria', 'centro_custo'], observed=True, dropna=False)['valor_abs']
+    if NUMBA_DISPONIVEL:
+        agregado = agrupado.sum(engine='numba', engine_kwargs=OPCOES_NUMBA_GROUPBY)
+    else:
+        agregado = agrupado.sum()
+    evolucao_mensal = agregado.groupby(level='mes_key').sum().reset_index()
+    evolucao_mensal['mes_ano'] = [formatar_mes_ano(chave) for chave in evolucao_mensal['mes_key']]
+    proporcao_valor = agregado.groupby(level='status', observed=True).sum()
+    top_categorias = get_maiores_valores(agregado.groupby(level='categoria', observed=True).sum(), 10)
+    top_centros_custo = get_maiores_valores(agregado.groupby(level='centro_custo', observed=True).sum(), 10, crescente=True)
+    return evolucao_mensal, proporcao_valor, top_categorias, top_centros_custo, agregado.sum(), len(df)
+
+# --- RENDERIZAÇÃO ---
+
+def renderizar_dashboard(caminho_arquivo):
+    """Desenha os filtros da barra lateral, os gráficos e a tabela detalhada de um dashboard salvo."""
+    st.sidebar.header("Filtros")
+    opcoes_categoria, opcoes_status, opcoes_centro_custo = get_opcoes_filtros(caminho_arquivo)
+    categorias = ['Todas'] + opcoes_categoria
+    categoria_selecionada = st.sidebar.multiselect("Categoria", categorias, default=['Todas'])
+    status_opcoes = ['Todos'] + opcoes_status
+    status_selecionado = st.sidebar.selectbox("Status", status_opcoes)
+    centros_custo = ['Todos'] + opcoes_centro_custo
+    centro_custo_selecionado = st.sidebar.multiselect("Centro de Custo", centros_custo, default=['Todos'])
+
+    filtros = (tuple(categoria_selecionada), status_selecionado, tuple(centro_custo_selecionado))
+    evolucao_mensal, proporcao_valor, top_categorias, top_centros_custo, total_despesas, _ = calcular_agregados(caminho_arquivo, *filtros)
+
+    st.subheader(f"Despesas Totais (R$): {total_despesas:,.2f}")
+    st.markdown("---")
+
+    row1_col1, row1_col2 = st.columns([3, 1])
+    row2_col1, row2_col2 = st.columns([2, 2])
+
+    # Gráficos guardados por sessão (e não em st.cache_resource, que é compartilhado entre
+    # usuários), já que seus dados são alterados a cada rerun.
+    if 'graficos' not in st.session_state:
+        st.session_state['graficos'] = criar_graficos_base()
+    graficos = st.session_state['graficos']
+
+    with row1_col1:
+        if not evolucao_mensal.empty:
+            fig = graficos['evolucao']
+            fig.data[0].x = evolucao_mensal['mes_ano'].tolist()
+            fig.data[0].y = evolucao_mensal['valor_abs'].to_numpy()
+            st.plotly_chart(fig, use_container_width=True, key='grafico_evolucao')
+
+    with row1_col2:
+        if not proporcao_valor.empty:
+            fig = graficos['status']
+            nomes_status = [str(status) for status in proporcao_valor.index]
+            cores_padrao = px.colors.qualitative.Plotly
+            fig.data[0].labels = nomes_status
+            fig.data[0].values = proporcao_valor.to_numpy()
+            fig.data[0].marker.colors = [CORES_STATUS.get(status, cores_padrao[i % len(cores_padrao)]) for i, status in enumerate(nomes_status)]
+            st.plotly_chart(fig, use_container_width=True, key='grafico_status')
+
+    with row2_col1:
+        if not top_categorias.empty:
+            fig = graficos['categorias']
+            fig.data[0].x = [str(categoria) for categoria in top_categorias.index]
+            fig.data[0].y = top_categorias.to_numpy()
+            st.plotly_chart(fig, use_container_width=True, key='grafico_categorias')
+
+    with row2_col2:
+        if not top_centros_custo.empty:
+            fig = graficos['centros_custo']
+            fig.data[0].x = top_centros_custo.to_numpy()
+            fig.data[0].y = [str(centro) for centro in top_centros_custo.index]
+            st.plotly_chart(fig, use_container_width=True, key='grafico_centros_custo')
+
+    st.markdown("---")
+    st.subheader("Lançamentos Detalhados")
+    # A tabela completa (com as descrições) só é lida quando o usuário pede.
+    if st.checkbox("Mostrar lançamentos detalhados"):
+        df = carregar_dashboard(caminho_arquivo, colunas=COLUNAS_DETALHE)
+        df_filtrado = aplicar_filtros(df, *filtros)
+        # Só a página atual é serializada e enviada ao navegador.
+        total_paginas = max(1, -(-len(df_filtrado) // LANCAMENTOS_POR_PAGINA))
+        pagina = st.number_input("Página", min_value=1, max_value=total_paginas, value=1, step=1)
+        inicio = (pagina - 1) * LANCAMENTOS_POR_PAGINA
+        st.dataframe(df_filtrado.iloc[inicio:inicio + LANCAMENTOS_POR_PAGINA], use_container_width=True)
+        st.caption(f"Página {pagina} de {total_paginas} ({len(df_filtrado)} lançamentos)")